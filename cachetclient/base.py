@@ -1,21 +1,73 @@
+import asyncio
 import json
-from typing import Generator, Union, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Dict, Generator, List
 
-from cachetclient.httpclient import HttpClient
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from cachetclient import utils
+from cachetclient.concurrency import (
+    AdaptiveSemaphore,
+    AsyncAdaptiveSemaphore,
+    is_throttled,
+)
+from cachetclient.httpclient import AsyncHttpClient, HttpClient
+
+
+def _stream_page(raw, meta_out: dict) -> Generator[dict, None, None]:
+    """Incrementally parse one list page with ijson.
+
+    Yields the entries under ``data`` one by one while picking the
+    total page count out of ``meta`` in the same pass, so pagination
+    never relies on guessing from the number of entries returned.
+
+    Args:
+        raw: The raw response stream
+        meta_out (dict): Receives ``total_pages`` when the
+                         pagination meta is seen
+
+    Returns:
+        Generator of dict entries
+    """
+    # Let urllib3 handle content-encoding before ijson sees the bytes
+    raw.decode_content = True
+    builder = None
+    for prefix, event, value in ijson.parse(raw):
+        if prefix == 'data.item' and event == 'start_map':
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif builder is not None and prefix.startswith('data.item'):
+            builder.event(event, value)
+            if prefix == 'data.item' and event == 'end_map':
+                yield builder.value
+                builder = None
+        elif prefix == 'meta.pagination.total_pages':
+            meta_out['total_pages'] = value
 
 
 class Resource:
     """Bag of attributes"""
-    def __init__(self, manager, data):
+    # Avoid allocating a __dict__ per instance. Subclasses not
+    # declaring __slots__ themselves still get one as usual.
+    __slots__ = ('_manager', '_data', '_dt_cache')
+
+    _data: Dict[str, Any]
+    _dt_cache: Dict[str, Any]
+
+    def __init__(self, manager, data: Dict[str, Any]):
         self._manager = manager
         self._data = data
+        self._dt_cache = {}
 
     @property
     def attrs(self) -> dict:
         """dict: The raw json respons from the server"""
         return self._data
 
-    def get(self, name) -> Union[int, str, float, bool]:
+    def get(self, name) -> Any:
         """
         Safely obtain any attribute name for the resource
 
@@ -28,6 +80,26 @@ class Resource:
         """
         return self._data.get(name)
 
+    def _datetime(self, name):
+        """
+        Obtain an attribute as a parsed datetime.
+
+        The parsed value is memoized so repeated reads
+        don't re-parse the timestamp string.
+
+        Args:
+            name (str): Key name in json response
+
+        Returns:
+            datetime: Parsed value or ``None`` if the key is missing
+        """
+        value = self._dt_cache.get(name)
+        if value is None:
+            value = utils.to_datetime(self.get(name))
+            self._dt_cache[name] = value
+
+        return value
+
     def update(self):
         """
         Posts the values in the resource to the server.
@@ -54,12 +126,39 @@ class Resource:
         return str(self._data)
 
 
+class BatchResult:
+    """
+    Result of a batch operation.
+
+    Collects the resources that were created or updated successfully
+    and the payloads that failed together with their exception,
+    so one bad payload doesn't abort the entire batch.
+    """
+
+    def __init__(self, successes: List[Resource], failures: list):
+        """
+        Args:
+            successes (List[Resource]): Resources from successful requests
+            failures (list): ``(payload, exception)`` tuples for failed requests
+        """
+        self.successes = successes
+        self.failures = failures
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if no request in the batch failed"""
+        return not self.failures
+
+    def __repr__(self) -> str:
+        return '<BatchResult successes={} failures={}>'.format(len(self.successes), len(self.failures))
+
+
 class Manager:
     """
     Base class for handling crud resources
     """
     resource_class = Resource
-    path = None  # Type: str
+    path: str = ''
 
     def __init__(self, http_client: HttpClient):
         self._http = http_client
@@ -67,7 +166,7 @@ class Manager:
         if self.resource_class is None:
             raise ValueError('resource_class not defined in class {}'.format(self.__class__))
 
-        if self.path is None:
+        if not self.path:
             raise ValueError('path not defined for class {}'.format(self.__class__))
 
     def instance_from_dict(self, data: dict) -> Resource:
@@ -123,9 +222,9 @@ class Manager:
 
     def _create(self, path: str, data: dict):
         response = self._http.post(path, data=data)
-        return self.resource_class(self, response.json()['data'])
+        return self.resource_class(self, utils.response_json(response)['data'])
 
-    def _update(self, path: str, resource_id: int, data: dict) -> Resource:
+    def _update(self, path: str, resource_id: int, data: dict) -> Any:
         """Generic resource updater
 
         Args:
@@ -137,11 +236,17 @@ class Manager:
             Resource: The updated resource from the server
         """
         response = self._http.put("{}/{}".format(path, resource_id), data=data)
-        return self.resource_class(self, response.json()['data'])
+        return self.resource_class(self, utils.response_json(response)['data'])
 
-    def _list_paginated(self, path: str, page=1, per_page=20) -> Generator[Resource, None, None]:
+    def _list_paginated(self, path: str, page=1, per_page=20) -> Generator[Any, None, None]:
         """List resources paginated.
 
+        When the optional ``ijson`` package is installed the response
+        body is parsed incrementally so resources are yielded as soon
+        as their json object boundary is reached, keeping the working
+        set independent of the page size. Otherwise the full page is
+        parsed with ``response.json()``.
+
         Args:
             path (str): url path relative to base url
 
@@ -152,6 +257,28 @@ class Manager:
         Returns:
             Generator of resources
         """
+        for entry in self._iter_paginated(path, page=page, per_page=per_page):
+            yield self.resource_class(self, utils.intern_keys(entry))
+
+    def _iter_paginated(self, path: str, page=1, per_page=20) -> Generator[dict, None, None]:
+        """List resources paginated, yielding raw dicts.
+
+        The streaming parser picks the total page count out of
+        ``meta`` in the same pass as the entries, so a server capping
+        ``per_page`` below the requested size cannot end the listing
+        early.
+
+        Args:
+            path (str): url path relative to base url
+
+        Keyword Args:
+            page (int): Page to start on
+            per_page (int): Number of entires per page
+
+        Returns:
+            Generator of dicts with the raw json data per resource
+        """
+        stream = ijson is not None
         while True:
             result = self._http.get(
                 path,
@@ -159,24 +286,94 @@ class Manager:
                     'page': page,
                     'per_page': per_page,
                 },
+                stream=stream,
             )
-            json_data = result.json()
 
-            meta = json_data['meta']
-            data = json_data['data']
-
-            for entry in data:
-                yield self.resource_class(self, entry)
-
-            if page >= meta['pagination']['total_pages']:
+            raw = getattr(result, 'raw', None) if stream else None
+            if raw is not None:
+                meta_out: dict = {}
+                try:
+                    yield from _stream_page(raw, meta_out)
+                finally:
+                    # Release the streamed connection back to the pool
+                    # even when the consumer abandons the generator
+                    result.close()
+                total_pages = meta_out.get('total_pages')
+            else:
+                json_data = utils.response_json(result)
+                yield from json_data['data']
+                total_pages = json_data['meta']['pagination']['total_pages']
+
+            if total_pages is None or page >= total_pages:
                 break
 
             page += 1
 
+    def _list_parallel(self, path: str, per_page=20, max_concurrency=16) -> Generator[Any, None, None]:
+        """List resources fetching pages concurrently.
+
+        The first page is fetched alone to obtain the total page count.
+        The remaining pages are then fetched concurrently in a thread
+        pool instead of one round trip at a time, with the effective
+        concurrency adapting to server throttling. Resources are
+        still yielded in page order.
+
+        Args:
+            path (str): url path relative to base url
+
+        Keyword Args:
+            per_page (int): Number of entires per page
+            max_concurrency (int): Max number of concurrent page requests
+
+        Returns:
+            Generator of resources
+        """
+        result = self._http.get(
+            path,
+            params={
+                'page': 1,
+                'per_page': per_page,
+            },
+        )
+        json_data = utils.response_json(result)
+        total_pages = json_data['meta']['pagination']['total_pages']
+
+        for entry in json_data['data']:
+            yield self.resource_class(self, utils.intern_keys(entry))
+
+        if total_pages <= 1:
+            return
+
+        pages = range(2, total_pages + 1)
+        limiter = AdaptiveSemaphore(start=max_concurrency, ceil=max_concurrency)
+
+        def fetch(page):
+            with limiter:
+                try:
+                    response = self._http.get(
+                        path,
+                        params={
+                            'page': page,
+                            'per_page': per_page,
+                        },
+                    )
+                except Exception as ex:
+                    if is_throttled(ex):
+                        limiter.throttle()
+                    raise
+
+                limiter.success()
+                return response
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(pages))) as executor:
+            for response in executor.map(fetch, pages):
+                for entry in utils.response_json(response)['data']:
+                    yield self.resource_class(self, utils.intern_keys(entry))
+
     # def _search(self, path, params=None):
     #     params = params or {}
     #     result = self._http.get(path, params={'per_page': 1, **params})
-    #     json_data = result.json()
+    #     json_data = utils.response_json(result)
 
     def _get(self, path: str, resource_id: int):
         """Generic resource getter (single)
@@ -189,7 +386,7 @@ class Manager:
             :py:data:`Resource`: A resource instance
         """
         result = self._http.get("{}/{}".format(path, resource_id))
-        json_data = result.json()
+        json_data = utils.response_json(result)
         return self.resource_class(self, json_data['data'])
 
     def _count(self, path: str) -> int:
@@ -203,7 +400,7 @@ class Manager:
             int: Number of resources
         """
         result = self._http.get(path, params={'per_page': 1})
-        json_data = result.json()
+        json_data = utils.response_json(result)
         return json_data['meta']['pagination']['total']
 
     def _delete(self, path: str, resource_id: int) -> None:
@@ -225,3 +422,203 @@ class Manager:
             dict: dict without `None` values
         """
         return {key: value for key, value in kwargs.items() if value is not None}
+
+
+class AsyncManager:
+    """
+    Base class for handling crud resources asynchronously.
+
+    Mirrors :py:class:`Manager` using an :py:class:`AsyncHttpClient`
+    so resource operations can be awaited and run concurrently,
+    for example with ``asyncio.gather``.
+    """
+    resource_class = Resource
+    path: str = ''
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+        if self.resource_class is None:
+            raise ValueError('resource_class not defined in class {}'.format(self.__class__))
+
+        if not self.path:
+            raise ValueError('path not defined for class {}'.format(self.__class__))
+
+    async def _create(self, path: str, data: dict):
+        response = await self._http.post(path, data=data)
+        return self.resource_class(self, utils.response_json(response)['data'])
+
+    async def _update(self, path: str, resource_id: int, data: dict) -> Any:
+        """Generic resource updater
+
+        Args:
+            path (str): url path relative to base url
+            resource_id (int): The resource to update
+            data (dict): New data
+
+        Returns:
+            Resource: The updated resource from the server
+        """
+        response = await self._http.put("{}/{}".format(path, resource_id), data=data)
+        return self.resource_class(self, utils.response_json(response)['data'])
+
+    async def _list_paginated(self, path: str, page=1, per_page=20) -> AsyncGenerator[Any, None]:
+        """List resources paginated.
+
+        The fetch for page N+1 is kicked off as a background task
+        before page N is handed out, hiding the network round trip
+        behind whatever work the consumer does per resource.
+
+        Args:
+            path (str): url path relative to base url
+
+        Keyword Args:
+            page (int): Page to start on
+            per_page (int): Number of entires per page
+
+        Returns:
+            Async generator of resources
+        """
+        async def fetch(fetch_page):
+            return await self._http.get(
+                path,
+                params={
+                    'page': fetch_page,
+                    'per_page': per_page,
+                },
+            )
+
+        result = await fetch(page)
+        next_task = None
+        try:
+            while True:
+                json_data = utils.response_json(result)
+
+                meta = json_data['meta']
+                data = json_data['data']
+
+                # Start fetching the next page before handing out this one
+                if page < meta['pagination']['total_pages']:
+                    next_task = asyncio.ensure_future(fetch(page + 1))
+
+                for entry in data:
+                    yield self.resource_class(self, utils.intern_keys(entry))
+
+                if next_task is None:
+                    break
+
+                result = await next_task
+                next_task = None
+                page += 1
+        finally:
+            # Don't leak the prefetch if the consumer stops early
+            if next_task is not None:
+                next_task.cancel()
+
+    async def _list_parallel(self, path: str, per_page=20, max_concurrency=16) -> AsyncGenerator[Any, None]:
+        """List resources fetching pages concurrently.
+
+        The first page is fetched alone to obtain the total page count.
+        The remaining pages are then fetched with ``asyncio.gather``
+        bounded by a limiter that adapts to server throttling instead
+        of one round trip at a time. Resources are still yielded in
+        page order.
+
+        Args:
+            path (str): url path relative to base url
+
+        Keyword Args:
+            per_page (int): Number of entires per page
+            max_concurrency (int): Max number of concurrent page requests
+
+        Returns:
+            Async generator of resources
+        """
+        result = await self._http.get(
+            path,
+            params={
+                'page': 1,
+                'per_page': per_page,
+            },
+        )
+        json_data = utils.response_json(result)
+        total_pages = json_data['meta']['pagination']['total_pages']
+
+        for entry in json_data['data']:
+            yield self.resource_class(self, utils.intern_keys(entry))
+
+        if total_pages <= 1:
+            return
+
+        limiter = AsyncAdaptiveSemaphore(start=max_concurrency, ceil=max_concurrency)
+
+        async def fetch(page):
+            async with limiter:
+                try:
+                    response = await self._http.get(
+                        path,
+                        params={
+                            'page': page,
+                            'per_page': per_page,
+                        },
+                    )
+                except Exception as ex:
+                    if is_throttled(ex):
+                        limiter.throttle()
+                    raise
+
+                limiter.success()
+                return response
+
+        responses = await asyncio.gather(*(fetch(page) for page in range(2, total_pages + 1)))
+        for response in responses:
+            for entry in utils.response_json(response)['data']:
+                yield self.resource_class(self, utils.intern_keys(entry))
+
+    async def _get(self, path: str, resource_id: int):
+        """Generic resource getter (single)
+
+        Args:
+            path (str): url path relative to base url
+            resource_id (int): The resource id to get
+
+        Returns:
+            :py:data:`Resource`: A resource instance
+        """
+        result = await self._http.get("{}/{}".format(path, resource_id))
+        json_data = utils.response_json(result)
+        return self.resource_class(self, json_data['data'])
+
+    async def _count(self, path: str) -> int:
+        """Generic count method
+        using the pagination system to obtain the total number of resources
+
+        Args:
+            path (str): url path relative to base url
+
+        Returns:
+            int: Number of resources
+        """
+        result = await self._http.get(path, params={'per_page': 1})
+        json_data = utils.response_json(result)
+        return json_data['meta']['pagination']['total']
+
+    async def _delete(self, path: str, resource_id: int) -> None:
+        """Generic resource deleter
+
+        Args:
+            path (str): url path relative to base url
+            resource_id (int): The resource to delete
+        """
+        await self._http.delete(path, resource_id)
+
+    def _build_data_dict(self, **kwargs) -> dict:
+        """Builds a data dictionary for posting to the server.
+
+        Will ommit key/value pars with None values.
+        This makes partial updates less error prone.
+
+        Returns:
+            dict: dict without `None` values
+        """
+        return {key: value for key, value in kwargs.items() if value is not None}
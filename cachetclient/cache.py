@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Tuple
+
+
+class TTLCache:
+    """
+    Simple in-process cache with per-entry time to live.
+
+    Entries are stored in an :py:class:`OrderedDict` together with
+    their expiry time (monotonic clock). The cache is bounded and
+    evicts the least recently used entry when full. Expired entries
+    are kept around until evicted so they can be served as a stale
+    fallback when the server is unreachable.
+
+    All operations take an internal lock, so one cache can be shared
+    by the batch helpers and coalesced reads running in thread pools.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Keyword Args:
+            maxsize (int): Max number of entries before LRU eviction
+        """
+        self._maxsize = maxsize
+        self._entries: 'OrderedDict[str, Tuple[Any, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key):
+        """
+        Look up a non-expired entry.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached value, or ``None`` if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expiry = entry
+            if time.monotonic() >= expiry:
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def get_stale(self, key):
+        """
+        Look up an entry ignoring expiry.
+
+        Used as a fallback when a fetch fails and stale
+        data is better than no data.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached value, or ``None`` if missing
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            return entry[0]
+
+    def set(self, key, value, ttl: float = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+            ttl (float): Seconds the entry is considered fresh.
+                         ``None`` and values <= 0 disable storing.
+        """
+        if ttl is None or ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key) -> None:
+        """
+        Remove a single entry if present.
+
+        Args:
+            key: The cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """
+        Remove all entries whose key starts with the given prefix.
+
+        Args:
+            prefix (str): The key prefix
+        """
+        with self._lock:
+            stale_keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in stale_keys:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
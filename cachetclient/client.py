@@ -8,7 +8,10 @@ def Client(
         endpoint: str = None,
         api_token: str = None,
         version: str = None,
-        verify_tls: bool = True) -> v1.Client:
+        verify_tls: bool = True,
+        cache_ttl: float = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3) -> v1.Client:
     """
     Creates a cachet client. Use this fuction to create clients to ensure
     compatibility in the future.
@@ -20,6 +23,9 @@ def Client(
         version (str): The api version. If not specified the version will be derived from the
                        endpoint url. The value "1" will create a v1 cachet client.
         verify_tls (bool): Enable/disable tls verify. When using self signed certificates this has to be ``False``.
+        cache_ttl (float): Seconds cached read responses are fresh. ``0`` disables response caching.
+        max_retries (int): Number of retries for transient server errors. ``0`` disables retries.
+        backoff_factor (float): Base delay in seconds for exponential backoff between retries.
     """
     if not api_token:
         api_token = os.environ.get('CACHET_API_TOKEN')
@@ -44,7 +50,16 @@ def Client(
     if not version:
         version = detect_version(endpoint)
 
-    return v1.Client(HttpClient(endpoint, api_token, verify_tls=verify_tls))
+    return v1.Client(
+        HttpClient(
+            endpoint,
+            api_token,
+            verify_tls=verify_tls,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+        ),
+        cache_ttl=cache_ttl,
+    )
 
 
 def detect_version(endpoint: str) -> str:
@@ -0,0 +1,251 @@
+import asyncio
+import threading
+
+from requests.exceptions import RetryError
+
+
+def is_throttled(ex: Exception) -> bool:
+    """Did the server throttle the request behind this exception?
+
+    Detects a 429 attached to requests and httpx error responses.
+    When the transport adapter's own retries are exhausted the 429
+    surfaces as a ``RetryError`` with no response attached; there the
+    urllib3 reason carries the status instead.
+    """
+    response = getattr(ex, 'response', None)
+    if getattr(response, 'status_code', None) == 429:
+        return True
+
+    if isinstance(ex, RetryError):
+        cause = ex.args[0] if ex.args else None
+        return '429' in str(getattr(cause, 'reason', ''))
+
+    return False
+
+
+class AdaptiveSemaphore:
+    """
+    Concurrency limiter adapting to server throttling (AIMD).
+
+    Works like a semaphore, but the limit is halved when the server
+    answers 429 (multiplicative decrease) and raised by one after a
+    streak of successes (additive increase), keeping bulk operations
+    close to the server's throughput ceiling without bursting into
+    throttled territory.
+    """
+
+    def __init__(self, start: int = 8, floor: int = 1, ceil: int = 64, increase_after: int = 10):
+        """
+        Keyword Args:
+            start (int): Initial concurrency limit
+            floor (int): Lowest limit throttling can reduce to
+            ceil (int): Highest limit successes can restore to
+            increase_after (int): Successes needed to raise the limit by one
+        """
+        self._limit = start
+        self._floor = floor
+        self._ceil = ceil
+        self._increase_after = increase_after
+        self._active = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """int: The current concurrency limit"""
+        return self._limit
+
+    def acquire(self) -> None:
+        """Block until a slot is free"""
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self) -> None:
+        """Give the slot back"""
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def throttle(self) -> None:
+        """Halve the limit after the server throttled a request"""
+        with self._cond:
+            self._limit = max(self._floor, self._limit // 2)
+            self._successes = 0
+
+    def success(self) -> None:
+        """Raise the limit by one after enough successful requests"""
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self._increase_after and self._limit < self._ceil:
+                self._limit += 1
+                self._successes = 0
+                self._cond.notify()
+
+    def __enter__(self) -> 'AdaptiveSemaphore':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+
+
+class AsyncAdaptiveSemaphore:
+    """
+    Async version of :py:class:`AdaptiveSemaphore`
+    for use inside a single event loop.
+    """
+
+    def __init__(self, start: int = 8, floor: int = 1, ceil: int = 64, increase_after: int = 10):
+        """
+        Keyword Args:
+            start (int): Initial concurrency limit
+            floor (int): Lowest limit throttling can reduce to
+            ceil (int): Highest limit successes can restore to
+            increase_after (int): Successes needed to raise the limit by one
+        """
+        self._limit = start
+        self._floor = floor
+        self._ceil = ceil
+        self._increase_after = increase_after
+        self._active = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """int: The current concurrency limit"""
+        return self._limit
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free"""
+        async with self._cond:
+            while self._active >= self._limit:
+                await self._cond.wait()
+            self._active += 1
+
+    async def release(self) -> None:
+        """Give the slot back"""
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def throttle(self) -> None:
+        """Halve the limit after the server throttled a request"""
+        self._limit = max(self._floor, self._limit // 2)
+        self._successes = 0
+
+    def success(self) -> None:
+        """Raise the limit by one after enough successful requests"""
+        self._successes += 1
+        if self._successes >= self._increase_after and self._limit < self._ceil:
+            self._limit += 1
+            self._successes = 0
+
+    async def __aenter__(self) -> 'AsyncAdaptiveSemaphore':
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.release()
+
+
+class _Flight:
+    """A request in flight shared by every caller asking for the same key"""
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent duplicate calls into one.
+
+    When several threads ask for the same key at the same time only
+    the first one executes the function. The others block until it
+    finishes and share its result (or its exception). Once the call
+    completes the key is released and the next call executes again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key: str, func):
+        """
+        Call ``func`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key (str): Key identifying duplicate calls
+            func (callable): Zero-argument function doing the work
+
+        Returns:
+            The return value of ``func``, possibly from another caller
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func()
+            return flight.result
+        except BaseException as ex:
+            flight.error = ex
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.event.set()
+
+
+class AsyncSingleFlight:
+    """
+    Async version of :py:class:`SingleFlight`
+    for use inside a single event loop.
+    """
+
+    def __init__(self):
+        self._flights = {}
+
+    async def do(self, key: str, func):
+        """
+        Await ``func()`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key (str): Key identifying duplicate calls
+            func (callable): Zero-argument coroutine function doing the work
+
+        Returns:
+            The result of ``func``, possibly from another caller
+        """
+        future = self._flights.get(key)
+        if future is not None:
+            return await future
+
+        future = asyncio.get_running_loop().create_future()
+        self._flights[key] = future
+        try:
+            result = await func()
+        except BaseException as ex:
+            future.set_exception(ex)
+            # Mark the exception as retrieved in case nobody joined
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
@@ -1,37 +1,120 @@
+import asyncio
 import logging
+import random
+from importlib.util import find_spec
 from urllib.parse import urljoin
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+#: Status codes considered transient and worth retrying
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+
+def _version_at_least(version: str, floor: tuple) -> bool:
+    """True if a dotted version string is at least ``floor``"""
+    try:
+        parts = tuple(int(part) for part in version.split('.')[:len(floor)])
+    except ValueError:
+        return False
+
+    return parts >= floor
+
+
+def _accept_encoding(zstd_capable: bool) -> str:
+    """Encodings the transport can decompress.
+
+    Json listings compress well, so advertise everything the
+    installed packages can actually decode. brotli and zstandard
+    are optional extras, and zstd additionally needs a transport
+    version that decodes it.
+    """
+    encodings = ['gzip', 'deflate']
+    if find_spec('brotli') is not None or find_spec('brotlicffi') is not None:
+        encodings.append('br')
+    if zstd_capable and find_spec('zstandard') is not None:
+        encodings.append('zstd')
+
+    return ', '.join(encodings)
+
+
+#: Header for the sync client. requests decodes zstd through urllib3 2.x only
+ACCEPT_ENCODING = _accept_encoding(_version_at_least(urllib3.__version__, (2,)))
+
+#: Header for the async client. httpx decodes zstd from 0.28 on
+ASYNC_ACCEPT_ENCODING = _accept_encoding(
+    httpx is not None and _version_at_least(httpx.__version__, (0, 28)),
+)
+
 
 class HttpClient:
+    """
+    Http client keeping a single pooled session for the lifetime
+    of the client so connections are reused across requests.
+
+    Transient server errors (429, 500, 502, 503, 504) are retried
+    with exponential backoff, honoring ``Retry-After``, before raising.
+    """
 
     def __init__(
             self, base_url: str,
             api_token: str,
             timeout: float = None,
             verify_tls: bool = True,
-            user_agent: str = None):
+            user_agent: str = None,
+            max_retries: int = 3,
+            backoff_factor: float = 0.3):
 
         self.base_url = base_url
         if not self.base_url.endswith('/'):
             self.base_url += '/'
+        self.api_token = api_token
         self.verify_tls = verify_tls
         self.timeout = timeout
         self.user_agent = user_agent
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
 
         self._session = requests.Session()
         self._session.headers.update({
             'X-Cachet-Token': api_token,
-            'User-Agent': user_agent,
+            # A None value removes the default User-Agent header
+            'User-Agent': user_agent,  # type: ignore[dict-item]
             'Accept': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Content-Type': 'application/json',
         })
 
-    def get(self, path, params=None) -> requests.Response:
-        return self.request('GET', path, params=params)
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=100,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUS_CODES,
+                respect_retry_after_header=True,
+                allowed_methods=['GET', 'POST', 'PUT', 'DELETE'],
+            ),
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def get(self, path, params=None, stream=False, headers=None) -> requests.Response:
+        return self.request('GET', path, params=params, stream=stream, headers=headers)
 
     def post(self, path, data) -> requests.Response:
         return self.request('POST', path, data=data)
@@ -42,15 +125,25 @@ class HttpClient:
     def delete(self, path, resource_id) -> requests.Response:
         return self.request('DELETE', "{}/{}".format(path, resource_id))
 
-    def request(self, method, path, params=None, data=None) -> requests.Response:
+    def request(self, method, path, params=None, data=None, stream=False, headers=None) -> requests.Response:
         url = urljoin(self.base_url, path)
+        # Serialize the body with orjson when available.
+        # The Content-Type header is already set on the session.
+        body = None
+        if data is not None and orjson is not None:
+            body = orjson.dumps(data)
+            data = None
+
         response = self._session.request(
             method,
             url,
             params=params,
             json=data,
+            data=body,
             verify=self.verify_tls,
             timeout=self.timeout,
+            stream=stream,
+            headers=headers,
         )
         logger.debug('%s %s', method, response.url)
         if response.ok:
@@ -58,3 +151,136 @@ class HttpClient:
 
         logger.debug(response.text)
         response.raise_for_status()
+        return response
+
+    def close(self) -> None:
+        """Close the underlying connection pool"""
+        self._session.close()
+
+    def __enter__(self) -> 'HttpClient':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class AsyncHttpClient:
+    """
+    Async version of :py:class:`HttpClient` built on ``httpx.AsyncClient``.
+
+    A single pooled client instance is kept for the lifetime of this
+    object so connections are reused across requests. This requires
+    the optional ``httpx`` package to be installed.
+    """
+
+    def __init__(
+            self, base_url: str,
+            api_token: str,
+            timeout: float = None,
+            verify_tls: bool = True,
+            user_agent: str = None,
+            max_connections: int = 100,
+            max_keepalive_connections: int = 50,
+            http2: bool = False,
+            max_retries: int = 3,
+            backoff_factor: float = 0.3):
+
+        if httpx is None:
+            raise ImportError(
+                "The httpx package is required for async support. "
+                "Install it with: pip install httpx"
+            )
+
+        self.base_url = base_url
+        if not self.base_url.endswith('/'):
+            self.base_url += '/'
+        self.api_token = api_token
+        self.verify_tls = verify_tls
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        self._client = httpx.AsyncClient(
+            verify=verify_tls,
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            headers={
+                'X-Cachet-Token': api_token,
+                'User-Agent': user_agent or '',
+                'Accept': 'application/json',
+                'Accept-Encoding': ASYNC_ACCEPT_ENCODING,
+                'Content-Type': 'application/json',
+            },
+        )
+
+    async def get(self, path, params=None):
+        return await self.request('GET', path, params=params)
+
+    async def post(self, path, data):
+        return await self.request('POST', path, data=data)
+
+    async def put(self, path, data):
+        return await self.request('PUT', path, data=data)
+
+    async def delete(self, path, resource_id):
+        return await self.request('DELETE', "{}/{}".format(path, resource_id))
+
+    async def request(self, method, path, params=None, data=None):
+        url = urljoin(self.base_url, path)
+        # Serialize the body with orjson when available.
+        # The Content-Type header is already set on the client.
+        body = None
+        if data is not None and orjson is not None:
+            body = orjson.dumps(data)
+            data = None
+
+        for attempt in range(self.max_retries + 1):
+            response = await self._client.request(
+                method,
+                url,
+                params=params,
+                json=data,
+                content=body,
+            )
+            logger.debug('%s %s', method, response.url)
+            if response.is_success:
+                return response
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                break
+
+            await asyncio.sleep(self._retry_delay(response, attempt))
+
+        logger.debug(response.text)
+        response.raise_for_status()
+
+    def _retry_delay(self, response, attempt: int) -> float:
+        """Seconds to sleep before the next attempt.
+
+        Exponential backoff with jitter, honoring the
+        ``Retry-After`` header when the server sends one.
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+        delay = self.backoff_factor * 2 ** attempt
+        return delay + random.uniform(0, self.backoff_factor)
+
+    async def close(self) -> None:
+        """Close the underlying connection pool"""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> 'AsyncHttpClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -1,6 +1,51 @@
 import re
+import sys
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def response_json(response):
+    """
+    Deserialize an http response body.
+
+    Uses the optional ``orjson`` package when installed, which
+    decodes considerably faster than the stdlib json module.
+
+    Args:
+        response: The http response object
+
+    Returns:
+        The deserialized body
+    """
+    if orjson is not None:
+        content = getattr(response, 'content', None)
+        if content is not None:
+            return orjson.loads(content)
+
+    return response.json()
+
+
+def intern_keys(data: dict) -> dict:
+    """
+    Rebuild a dict with interned keys.
+
+    Resources share the same handful of key strings
+    (``id``, ``status``, ``name``, ...). Interning them makes
+    every dict in a large listing reference one key object
+    instead of a fresh string per entry.
+
+    Args:
+        data (dict): The dict to rebuild
+
+    Returns:
+        dict: dict with interned keys
+    """
+    return {sys.intern(key): value for key, value in data.items()}
+
 
 def to_datetime(timestamp: str):
     """
@@ -18,6 +63,13 @@ def to_datetime(timestamp: str):
     if timestamp is None:
         return None
 
+    # '2019-05-24 09:26:22'. fromisoformat is several times
+    # faster than strptime
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        pass
+
     try:
         # '2019-05-24 09:26:22'
         return datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
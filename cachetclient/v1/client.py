@@ -1,7 +1,10 @@
-from cachetclient.httpclient import HttpClient
+import asyncio
+from typing import Optional
+
+from cachetclient.httpclient import AsyncHttpClient, HttpClient
 from cachetclient.v1.component_groups import CompontentGroupManager
 from cachetclient.v1.components import ComponentManager
-from cachetclient.v1.incidents import IncidentManager
+from cachetclient.v1.incidents import AsyncIncidentManager, IncidentManager
 from cachetclient.v1.incident_updates import IncidentUpdatesManager
 from cachetclient.v1.metrics import MetricsManager
 from cachetclient.v1.subscribers import SubscriberManager
@@ -12,10 +15,14 @@ from cachetclient.v1.schedules import ScheduleManager
 
 class Client:
 
-    def __init__(self, http_client: HttpClient):
+    def __init__(self, http_client: HttpClient, cache_ttl: float = None):
         """
         Args:
             http_client: The http client class to use
+
+        Keyword Args:
+            cache_ttl (float): Seconds cached read responses are fresh.
+                               ``0`` disables response caching.
         """
         self._http = http_client
 
@@ -25,7 +32,68 @@ class Client:
         self.components = ComponentManager(self._http)
         self.component_groups = CompontentGroupManager(self._http, self.components)
         self.incident_updates = IncidentUpdatesManager(self._http)
-        self.incidents = IncidentManager(self._http, self.incident_updates)
+        self.incidents = IncidentManager(self._http, self.incident_updates, cache_ttl=cache_ttl)
         self.metrics = MetricsManager(self._http)
         self.subscribers = SubscriberManager(self._http)
         self.schedules = ScheduleManager(self._http)
+
+        # Async managers are created lazily since they
+        # require the optional httpx package
+        self._incidents_async: Optional[AsyncIncidentManager] = None
+
+    def close(self) -> None:
+        """Close the underlying http connection pool.
+
+        The async pool created by :py:attr:`incidents_async` is also
+        closed when no event loop is running. Inside a running loop
+        use :py:meth:`aclose` for it instead.
+        """
+        self._http.close()
+
+        if self._incidents_async is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self._incidents_async._http.close())
+                self._incidents_async = None
+
+    async def aclose(self) -> None:
+        """Close the async connection pool created by :py:attr:`incidents_async`.
+
+        Does nothing if the async manager was never accessed.
+        """
+        if self._incidents_async is not None:
+            await self._incidents_async._http.close()
+            self._incidents_async = None
+
+    def __enter__(self) -> 'Client':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def incidents_async(self) -> AsyncIncidentManager:
+        """
+        AsyncIncidentManager: Async version of the incident manager.
+
+        The manager and its pooled async http client are created on
+        first access and live until :py:meth:`aclose` or
+        :py:meth:`close` is called. Requires the optional ``httpx``
+        package.
+        """
+        if self._incidents_async is None:
+            self._incidents_async = AsyncIncidentManager(
+                AsyncHttpClient(
+                    self._http.base_url,
+                    self._http.api_token,
+                    timeout=self._http.timeout,
+                    verify_tls=self._http.verify_tls,
+                    user_agent=self._http.user_agent,
+                    max_retries=getattr(self._http, 'max_retries', 3),
+                    backoff_factor=getattr(self._http, 'backoff_factor', 0.3),
+                ),
+                self.incident_updates,
+            )
+
+        return self._incidents_async
@@ -31,7 +31,7 @@ class IndicentUpdate(Resource):
         """str: Get or set message"""
         return self.get('message')
 
-    @messages.setter
+    @messages.setter  # type: ignore[attr-defined]
     def message(self, value: str):
         self._data['message'] = value
 
@@ -1,68 +1,122 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Generator
+from typing import AsyncGenerator, List, Generator
 
-from cachetclient.base import Manager, Resource
+from requests.exceptions import ConnectionError, HTTPError, RetryError, Timeout
+
+from cachetclient.base import AsyncManager, BatchResult, Manager, Resource
 from cachetclient import utils
+from cachetclient.cache import TTLCache
+from cachetclient.concurrency import (
+    AdaptiveSemaphore,
+    AsyncAdaptiveSemaphore,
+    AsyncSingleFlight,
+    SingleFlight,
+    is_throttled,
+)
 from cachetclient.v1.incident_updates import IncidentUpdatesManager
-from cachetclient.httpclient import HttpClient
+from cachetclient.httpclient import AsyncHttpClient, HttpClient
+
+# Payload keys for create in parameter order so the data dict
+# can be built in one pass instead of rebuilt per call
+_CREATE_KEYS = (
+    'name',
+    'message',
+    'status',
+    'visible',
+    'component_id',
+    'component_status',
+    'notify',
+    'created_at',
+    'template',
+    'vars',
+)
+
+
+def _update_payload(
+        name, message, status, visible, component_id,
+        component_status, notify, created_at, template, template_vars) -> dict:
+    """Build the update request body in a single pass.
+
+    Optional values are skipped at insertion time instead of built
+    into a kwargs dict and filtered afterwards, so update loops
+    allocate one dict per call instead of two.
+    """
+    payload = {
+        'name': name,
+        'message': message,
+        'status': status,
+        'visible': 1 if visible else 0,
+        'notify': 1 if notify else 0,
+    }
+    if component_id is not None:
+        payload['component_id'] = component_id
+    if component_status is not None:
+        payload['component_status'] = component_status
+    if created_at is not None:
+        payload['created_at'] = created_at
+    if template is not None:
+        payload['template'] = template
+    if template_vars is not None:
+        payload['vars'] = template_vars
+
+    return payload
 
 
 class Incident(Resource):
-
-    @property
-    def id(self) -> int:
-        """int: unique id of the incident"""
-        return self.get('id')
-
-    @property
-    def component_id(self) -> int:
-        """int: Get or set component id for this incident"""
-        return self.get('component_id')
-
-    @component_id.setter
-    def component_id(self, value: int):
-        self._data['component_id'] = value
-
-    @property
-    def name(self) -> str:
-        """str: Get or set name/title of the incident"""
-        return self.get('name')
-
-    @name.setter
-    def name(self, value: str):
-        self._data['name'] = value
-
-    @property
-    def message(self) -> str:
-        """str: Get or set message"""
-        return self.get('message')
-
-    @message.setter
-    def message(self, value: str):
-        self._data['message'] = value
-
-    @property
-    def notify(self) -> str:
-        """bool: Get or set notification flag"""
-        return self.get('notify')
-
-    @notify.setter
-    def notify(self, value: bool):
-        self._data['notify'] = value
-
-    @property
-    def status(self) -> int:
-        """int: Get or set status. See :py:data:`enums`"""
-        return self.get('status')
-
-    @status.setter
-    def status(self, value: int):
-        self._data['status'] = value
-
-    @property
-    def human_status(self) -> str:
-        """str: Human representation of the status"""
-        return self.get('human_status')
+    """
+    Incident resource.
+
+    The plain json fields are exposed directly as attributes
+    through :py:meth:`__getattr__` instead of one property per
+    field, collapsing each read into a single dict lookup:
+
+    - ``id`` (int): unique id of the incident
+    - ``component_id`` (int): Get or set component id for this incident
+    - ``name`` (str): Get or set name/title of the incident
+    - ``message`` (str): Get or set message
+    - ``notify`` (bool): Get or set notification flag
+    - ``status`` (int): Get or set status. See :py:data:`enums`
+    - ``human_status`` (str): Human representation of the status
+
+    Fields needing type conversion (``visible`` and the datetime
+    fields) remain regular properties.
+    """
+    __slots__ = ()
+
+    #: Plain json fields exposed directly as attributes
+    _FIELDS = frozenset((
+        'id',
+        'component_id',
+        'name',
+        'message',
+        'notify',
+        'status',
+        'human_status',
+    ))
+    #: The subset of fields that can be assigned
+    _SETTABLE = frozenset((
+        'component_id',
+        'name',
+        'message',
+        'notify',
+        'status',
+    ))
+
+    def __getattr__(self, name):
+        # Underscored lookups ending up here mean the slot is not
+        # assigned yet. Never resolve them through _data.
+        if name[0] != '_' and name in self._FIELDS:
+            return self._data.get(name)
+
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name in self._SETTABLE:
+            self._data[name] = value
+        else:
+            super().__setattr__(name, value)
 
     @property
     def visible(self) -> int:
@@ -79,22 +133,22 @@ class Incident(Resource):
         like maintenance in Cachet 2.3 were incident status is ``INCIDENT_SCHEDULED``.
         2.4 has its own schedule resource and endpoints.
         """
-        return utils.to_datetime(self.get('scheduled_at'))
+        return self._datetime('scheduled_at')
 
     @property
     def created_at(self) -> datetime:
         """datetime: When the issue was created"""
-        return utils.to_datetime(self.get('created_at'))
+        return self._datetime('created_at')
 
     @property
     def updated_at(self) -> datetime:
         """datetime: Last time the issue was updated"""
-        return utils.to_datetime(self.get('updated_at'))
+        return self._datetime('updated_at')
 
     @property
     def deleted_at(self) -> datetime:
         """datetime: When the issue was deleted"""
-        return utils.to_datetime(self.get('deleted_at'))
+        return self._datetime('deleted_at')
 
     def updates(self) -> Generator['Incident', None, None]:
         """Generator['Incident', None, None]: Incident updates for this issue"""
@@ -104,11 +158,26 @@ class Incident(Resource):
 class IncidentManager(Manager):
     resource_class = Incident
     path = 'incidents'
+    #: Default seconds a cached :py:meth:`get` response is fresh
+    get_cache_ttl = 15.0
+    #: Default seconds a cached :py:meth:`count` response is fresh
+    count_cache_ttl = 5.0
 
-    def __init__(self, http_client: HttpClient, incident_update_manager: IncidentUpdatesManager):
+    def __init__(
+            self,
+            http_client: HttpClient,
+            incident_update_manager: IncidentUpdatesManager,
+            cache_ttl: float = None):
         super().__init__(http_client)
         self.updates = incident_update_manager
 
+        if cache_ttl is not None:
+            self.get_cache_ttl = cache_ttl
+            self.count_cache_ttl = min(cache_ttl, self.count_cache_ttl)
+
+        self._cache = TTLCache()
+        self._singleflight = SingleFlight()
+
     def create(
             self,
             *,
@@ -142,29 +211,33 @@ class IncidentManager(Manager):
         Returns:
             Incident instance
         """
-        return self._create(
+        values = (
+            name,
+            message,
+            status,
+            1 if visible else 0,
+            component_id,
+            component_status,
+            1 if notify else 0,
+            created_at,
+            template,
+            template_vars,
+        )
+        incident = self._create(
             self.path,
-            {
-                'name': name,
-                'message': message,
-                'status': status,
-                'visible': 1 if visible else 0,
-                'component_id': component_id,
-                'component_status': component_status,
-                'notify': 1 if notify else 0,
-                'created_at': created_at,
-                'template': template,
-                'vars': template_vars,
-            }
+            {key: value for key, value in zip(_CREATE_KEYS, values) if value is not None},
         )
+        self._cache.invalidate_prefix(self.path)
+        return incident
 
     def update(
             self,
             incident_id: int,
-            name: str = None,
-            message: str = None,
-            status: int = None,
-            visible: bool = None,
+            *,
+            name: str,
+            message: str,
+            status: int,
+            visible: bool,
             component_id: int = None,
             component_status: int = None,
             notify: bool = True,
@@ -193,29 +266,102 @@ class IncidentManager(Manager):
         Returns:
             Updated incident Instance
         """
-        if name is None or message is None or status is None or visible is None:
-            raise ValueError('name, message, status and visible are required parameters')
-
-        return self._update(
+        incident = self._update(
             self.path,
             incident_id,
-            self._build_data_dict(
-                name=name,
-                message=message,
-                status=status,
-                visible=1 if visible else 0,
-                component_id=component_id,
-                component_status=component_status,
-                notify=1 if notify else 0,
-                created_at=created_at,
-                template=template,
-                vars=template_vars,
-            )
+            _update_payload(
+                name, message, status, visible, component_id,
+                component_status, notify, created_at, template, template_vars,
+            ),
         )
+        self._cache.invalidate_prefix(self.path)
+        return incident
 
-    def list(self, page: int = 1, per_page: int = 1) -> Generator[Incident, None, None]:
+    def create_many(self, incidents: List[dict], concurrency: int = 8) -> BatchResult:
         """
-        List all incidents paginated
+        Create many incidents concurrently.
+
+        Cachet has no batch endpoint so one POST is still issued per
+        incident, but the requests are overlapped in a thread pool
+        over the shared pooled session. Failed payloads are collected
+        in the result instead of aborting the batch.
+
+        Args:
+            incidents (List[dict]): Keyword arguments for :py:meth:`create` per incident
+
+        Keyword Args:
+            concurrency (int): Max number of concurrent requests
+
+        Returns:
+            :py:class:`BatchResult` with created incidents and failures
+        """
+        def call(payload):
+            return self.create(**payload)
+
+        return self._batch(call, incidents, concurrency)
+
+    def update_many(self, incidents: List[dict], concurrency: int = 8) -> BatchResult:
+        """
+        Update many incidents concurrently.
+
+        Each entry must contain an ``incident_id`` key in addition
+        to the keyword arguments accepted by :py:meth:`update`.
+        Failed payloads are collected in the result instead of
+        aborting the batch.
+
+        Args:
+            incidents (List[dict]): Keyword arguments for :py:meth:`update` per incident
+
+        Keyword Args:
+            concurrency (int): Max number of concurrent requests
+
+        Returns:
+            :py:class:`BatchResult` with updated incidents and failures
+        """
+        def call(payload):
+            params = dict(payload)
+            return self.update(params.pop('incident_id'), **params)
+
+        return self._batch(call, incidents, concurrency)
+
+    def _batch(self, func, payloads: List[dict], concurrency: int) -> BatchResult:
+        """Run one request per payload in a thread pool collecting failures.
+
+        The effective concurrency adapts to server throttling:
+        a 429 halves it, sustained successes restore it.
+        """
+        limiter = AdaptiveSemaphore(start=concurrency, ceil=concurrency)
+
+        def call(payload):
+            with limiter:
+                try:
+                    result = func(payload)
+                except Exception as ex:
+                    if is_throttled(ex):
+                        limiter.throttle()
+                    return ex
+
+                limiter.success()
+                return result
+
+        successes = []
+        failures = []
+        with ThreadPoolExecutor(max_workers=min(concurrency, max(len(payloads), 1))) as executor:
+            for payload, result in zip(payloads, executor.map(call, payloads)):
+                if isinstance(result, Exception):
+                    failures.append((payload, result))
+                else:
+                    successes.append(result)
+
+        return BatchResult(successes, failures)
+
+    def list(self, page: int = 1, per_page: int = 20) -> Generator[Incident, None, None]:
+        """
+        List all incidents paginated.
+
+        Pages are cached like :py:meth:`get` responses and
+        re-validated with ``If-None-Match`` after expiry when the
+        server sent an ETag, making repeated polling cheap.
 
         Keyword Args:
             page (int): Page to start on
@@ -224,15 +370,139 @@ class IncidentManager(Manager):
         Returns:
             Generator of :py:data:`Incident`s
         """
-        return self._list_paginated(
+        while True:
+            body = self._cached_get(
+                '{}?page={}&per_page={}'.format(self.path, page, per_page),
+                self.path,
+                params={'page': page, 'per_page': per_page},
+                ttl=self.get_cache_ttl,
+            )
+
+            for entry in body['data']:
+                yield self.resource_class(self, utils.intern_keys(entry))
+
+            if page >= body['meta']['pagination']['total_pages']:
+                break
+
+            page += 1
+
+    def list_raw(self, page: int = 1, per_page: int = 20) -> Generator[dict, None, None]:
+        """
+        List all incidents paginated, yielding raw dicts.
+
+        Skips constructing :py:data:`Incident` wrappers entirely,
+        streams pages incrementally when ``ijson`` is installed and
+        bypasses the response cache so very large incident histories
+        can be walked without retaining every page body.
+
+        Keyword Args:
+            page (int): Page to start on
+            per_page (int): Entires per page
+
+        Returns:
+            Generator of dicts with the raw json data per incident
+        """
+        return self._iter_paginated(self.path, page=page, per_page=per_page)
+
+    def list_parallel(self, per_page: int = 20, max_concurrency: int = 16) -> Generator[Incident, None, None]:
+        """
+        List all incidents fetching pages concurrently.
+
+        Page 1 is fetched first to learn the total page count.
+        The remaining pages are then requested in parallel instead
+        of one round trip at a time.
+
+        Keyword Args:
+            per_page (int): Entires per page
+            max_concurrency (int): Max number of concurrent page requests
+
+        Returns:
+            Generator of :py:data:`Incident`s
+        """
+        return self._list_parallel(
             self.path,
-            page=page,
             per_page=per_page,
+            max_concurrency=max_concurrency,
         )
 
+    def _cached_get(self, key: str, url: str, params: dict = None, ttl: float = None) -> dict:
+        """Cached conditional GET returning the parsed response body.
+
+        Fresh cache entries are served directly. When an entry has
+        expired but carries an ETag, the request is made with
+        ``If-None-Match`` and a ``304 Not Modified`` answer revives
+        the cached body without re-downloading it. On connection
+        errors, timeouts, exhausted retries and server errors (5xx)
+        a stale entry is served as fallback if present. Client
+        errors (4xx) always raise.
+
+        Concurrent calls for the same key are coalesced: only one
+        thread issues the request and the others share its parsed
+        response.
+
+        Args:
+            key (str): The cache key
+            url (str): url path relative to base url
+
+        Keyword Args:
+            params (dict): Optional query parameters
+            ttl (float): Seconds the entry stays fresh
+
+        Returns:
+            dict: The parsed response body
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached['body']
+
+        return self._singleflight.do(key, lambda: self._fetch(key, url, params, ttl))
+
+    def _fetch(self, key: str, url: str, params: dict = None, ttl: float = None) -> dict:
+        """Fetch, parse and cache one response for :py:meth:`_cached_get`"""
+        stale = self._cache.get_stale(key)
+        headers = None
+        if stale is not None and stale.get('etag'):
+            headers = {'If-None-Match': stale['etag']}
+
+        try:
+            response = self._http.get(url, params=params, headers=headers)
+        except (ConnectionError, Timeout, RetryError):
+            # Unreachable server or transient errors that exhausted
+            # the adapter's retries. Serve a stale entry if we have one
+            if stale is not None:
+                return stale['body']
+            raise
+        except HTTPError as ex:
+            # Only server errors fall back to stale data. Client errors
+            # like 404 are real answers and must reach the caller
+            status = getattr(getattr(ex, 'response', None), 'status_code', None)
+            if stale is not None and status is not None and status >= 500:
+                return stale['body']
+            raise
+
+        if response.status_code == 304 and stale is not None:
+            # Nothing changed server side. The stale entry is fresh again
+            self._cache.set(key, stale, ttl)
+            return stale['body']
+
+        body = utils.response_json(response)
+        entry = {
+            'body': body,
+            'etag': getattr(response, 'headers', {}).get('ETag'),
+        }
+        self._cache.set(key, entry, ttl)
+        return body
+
     def get(self, incident_id: int) -> Incident:
         """
-        Get a single incident
+        Get a single incident.
+
+        Responses are cached for a short period
+        (:py:data:`get_cache_ttl`) so repeated reads of the same
+        incident don't hit the server, and re-validated with
+        ``If-None-Match`` after expiry when the server sent an ETag.
+        The cache is invalidated by ``create``, ``update`` and
+        ``delete``.
 
         Args:
             incident_id (int): The incident id to get
@@ -243,16 +513,32 @@ class IncidentManager(Manager):
         Raises:
             :py:data:`requests.exception.HttpError`: if incident do not exist
         """
-        return self._get(self.path, incident_id)
+        body = self._cached_get(
+            '{}/{}'.format(self.path, incident_id),
+            '{}/{}'.format(self.path, incident_id),
+            ttl=self.get_cache_ttl,
+        )
+        return self.resource_class(self, dict(body['data']))
 
     def count(self) -> int:
         """
-        Count the number of incidents
+        Count the number of incidents.
+
+        Responses are cached for a short period
+        (:py:data:`count_cache_ttl`) so repeated counting
+        don't hit the server. The cache is invalidated
+        by ``create``, ``update`` and ``delete``.
 
         Returns:
             int: Total number of incidents
         """
-        return self._count(self.path)
+        body = self._cached_get(
+            '{}?count'.format(self.path),
+            self.path,
+            params={'per_page': 1},
+            ttl=self.count_cache_ttl,
+        )
+        return body['meta']['pagination']['total']
 
     def delete(self, incident_id: int) -> None:
         """
@@ -262,3 +548,278 @@ class IncidentManager(Manager):
             incident_id (int): The incident id
         """
         self._delete(self.path, incident_id)
+        self._cache.invalidate_prefix(self.path)
+
+
+class AsyncIncidentManager(AsyncManager):
+    """
+    Async version of :py:class:`IncidentManager`.
+
+    All operations are coroutines issued over a shared pooled
+    ``httpx.AsyncClient``, so independent incident operations can be
+    overlapped with ``asyncio.gather``.
+    """
+    resource_class = Incident
+    path = 'incidents'
+
+    def __init__(self, http_client: AsyncHttpClient, incident_update_manager: IncidentUpdatesManager = None):
+        super().__init__(http_client)
+        self.updates = incident_update_manager
+        self._singleflight = AsyncSingleFlight()
+
+    async def acreate(
+            self,
+            *,
+            name: str,
+            message: str,
+            status: int,
+            visible: bool = True,
+            component_id: int = None,
+            component_status: int = None,
+            notify: bool = True,
+            created_at: datetime = None,
+            template: str = None,
+            template_vars: List[str] = None) -> Incident:
+        """
+        Create and general issue or issue for a component.
+        component_id and component_status must be supplied when making
+        a component issue.
+
+        Keyword Args:
+            name (str): Name/title of the issue
+            message (str): Mesage body for the issue
+            status (int): Status of the incident (see enums)
+            visible (bool): Publicly visible incident
+            component_id (int): The component to update
+            component_status (int): The status to apply on component
+            notify (bool): If users should be notified
+            created_at: when the indicent was created
+            template (str): Slug of template to use
+            template_vars (list): Variables to the template
+
+        Returns:
+            Incident instance
+        """
+        values = (
+            name,
+            message,
+            status,
+            1 if visible else 0,
+            component_id,
+            component_status,
+            1 if notify else 0,
+            created_at,
+            template,
+            template_vars,
+        )
+        return await self._create(
+            self.path,
+            {key: value for key, value in zip(_CREATE_KEYS, values) if value is not None},
+        )
+
+    async def aupdate(
+            self,
+            incident_id: int,
+            *,
+            name: str,
+            message: str,
+            status: int,
+            visible: bool,
+            component_id: int = None,
+            component_status: int = None,
+            notify: bool = True,
+            created_at: datetime = None,
+            template: str = None,
+            template_vars: List[str] = None,
+            **kwargs) -> Incident:
+        """
+        Update an incident.
+
+        Args:
+            incident_id (int): The incident to update
+
+        Keyword Args:
+            name (str): Name/title of the issue
+            message (str): Mesage body for the issue
+            status (int): Status of the incident (see enums)
+            visible (bool): Publicly visible incident
+            component_id (int): The component to update
+            component_status (int): The status to apply on component
+            notify (bool): If users should be notified
+            created_at: when the indicent was created
+            template (str): Slug of template to use
+            template_vars (list): Variables to the template
+
+        Returns:
+            Updated incident Instance
+        """
+        return await self._update(
+            self.path,
+            incident_id,
+            _update_payload(
+                name, message, status, visible, component_id,
+                component_status, notify, created_at, template, template_vars,
+            ),
+        )
+
+    async def acreate_many(self, incidents: List[dict], concurrency: int = 8) -> BatchResult:
+        """
+        Create many incidents concurrently.
+
+        Cachet has no batch endpoint so one POST is still issued per
+        incident, but the requests are overlapped with
+        ``asyncio.gather`` bounded by a semaphore. Failed payloads
+        are collected in the result instead of aborting the batch.
+
+        Args:
+            incidents (List[dict]): Keyword arguments for :py:meth:`acreate` per incident
+
+        Keyword Args:
+            concurrency (int): Max number of concurrent requests
+
+        Returns:
+            :py:class:`BatchResult` with created incidents and failures
+        """
+        async def call(payload):
+            return await self.acreate(**payload)
+
+        return await self._batch(call, incidents, concurrency)
+
+    async def aupdate_many(self, incidents: List[dict], concurrency: int = 8) -> BatchResult:
+        """
+        Update many incidents concurrently.
+
+        Each entry must contain an ``incident_id`` key in addition
+        to the keyword arguments accepted by :py:meth:`aupdate`.
+        Failed payloads are collected in the result instead of
+        aborting the batch.
+
+        Args:
+            incidents (List[dict]): Keyword arguments for :py:meth:`aupdate` per incident
+
+        Keyword Args:
+            concurrency (int): Max number of concurrent requests
+
+        Returns:
+            :py:class:`BatchResult` with updated incidents and failures
+        """
+        async def call(payload):
+            params = dict(payload)
+            return await self.aupdate(params.pop('incident_id'), **params)
+
+        return await self._batch(call, incidents, concurrency)
+
+    async def _batch(self, func, payloads: List[dict], concurrency: int) -> BatchResult:
+        """Run one request per payload with bounded concurrency collecting failures.
+
+        The effective concurrency adapts to server throttling:
+        a 429 halves it, sustained successes restore it.
+        """
+        limiter = AsyncAdaptiveSemaphore(start=concurrency, ceil=concurrency)
+
+        async def call(payload):
+            async with limiter:
+                try:
+                    result = await func(payload)
+                except Exception as ex:
+                    if is_throttled(ex):
+                        limiter.throttle()
+                    return ex
+
+                limiter.success()
+                return result
+
+        results = await asyncio.gather(*(call(payload) for payload in payloads), return_exceptions=True)
+
+        successes: List[Resource] = []
+        failures = []
+        for payload, result in zip(payloads, results):
+            if isinstance(result, BaseException):
+                failures.append((payload, result))
+            else:
+                successes.append(result)
+
+        return BatchResult(successes, failures)
+
+    def alist(self, page: int = 1, per_page: int = 20) -> AsyncGenerator[Incident, None]:
+        """
+        List all incidents paginated
+
+        Keyword Args:
+            page (int): Page to start on
+            per_page (int): Entires per page
+
+        Returns:
+            Async generator of :py:data:`Incident`s
+        """
+        return self._list_paginated(
+            self.path,
+            page=page,
+            per_page=per_page,
+        )
+
+    def alist_parallel(self, per_page: int = 20, max_concurrency: int = 16) -> AsyncGenerator[Incident, None]:
+        """
+        List all incidents fetching pages concurrently.
+
+        Page 1 is fetched first to learn the total page count.
+        The remaining pages are then requested with ``asyncio.gather``
+        bounded by a semaphore.
+
+        Keyword Args:
+            per_page (int): Entires per page
+            max_concurrency (int): Max number of concurrent page requests
+
+        Returns:
+            Async generator of :py:data:`Incident`s
+        """
+        return self._list_parallel(
+            self.path,
+            per_page=per_page,
+            max_concurrency=max_concurrency,
+        )
+
+    async def aget(self, incident_id: int) -> Incident:
+        """
+        Get a single incident.
+
+        Concurrent calls for the same incident are coalesced: only
+        one request is issued and parsed. Each caller still gets its
+        own instance wrapping a copy of the data, so mutating one
+        result cannot leak into another.
+
+        Args:
+            incident_id (int): The incident id to get
+
+        Returns:
+            :py:data:`Incident` instance
+
+        Raises:
+            :py:data:`httpx.HTTPStatusError`: if incident do not exist
+        """
+        path = '{}/{}'.format(self.path, incident_id)
+
+        async def fetch():
+            response = await self._http.get(path)
+            return utils.response_json(response)
+
+        body = await self._singleflight.do(path, fetch)
+        return self.resource_class(self, dict(body['data']))
+
+    async def acount(self) -> int:
+        """
+        Count the number of incidents
+
+        Returns:
+            int: Total number of incidents
+        """
+        return await self._count(self.path)
+
+    async def adelete(self, incident_id: int) -> None:
+        """
+        Delete an incident
+
+        Args:
+            incident_id (int): The incident id
+        """
+        await self._delete(self.path, incident_id)
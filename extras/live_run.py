@@ -7,8 +7,11 @@ Set the following enviroment variables before running the script:
 - CACHET_ENDPOINT (eg: http://test.example.com/api/v1)
 - CACHET_API_TOKEN (eg. Wohc7eeGhaewae7zie1E)
 """
+import asyncio
+import io
 import os
 import sys
+import threading
 import traceback
 from datetime import datetime
 from pprint import pprint
@@ -19,7 +22,6 @@ from cachetclient.v1 import enums
 
 CACHET_ENDPOINT = os.environ.get('CACHET_ENDPOINT')
 CACHET_API_TOKEN = os.environ.get('CACHET_API_TOKEN')
-CLIENT = None
 
 
 class Stats:
@@ -45,12 +47,37 @@ class Stats:
         return round(cls.NUM_TESTS_SUCCESS * 100 / cls.NUM_TESTS, 2)
 
 
-def client() -> Client:
-    global CLIENT
-    if CLIENT is None:
-        CLIENT = cachetclient.Client(endpoint=CACHET_ENDPOINT, api_token=CACHET_API_TOKEN)
+class ThreadOutput:
+    """
+    Stdout proxy routing writes to a per-thread buffer when one
+    is registered. Lets concurrently running tests print without
+    interleaving: each test writes to its own buffer which is
+    flushed to the real stream in one go when the test is done.
+    """
 
-    return CLIENT
+    def __init__(self, stream):
+        self._stream = stream
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    def register(self):
+        """Start buffering output for the calling thread"""
+        self._buffers[threading.get_ident()] = io.StringIO()
+
+    def release(self):
+        """Stop buffering and flush the calling thread's output"""
+        buffer = self._buffers.pop(threading.get_ident())
+        with self._lock:
+            self._stream.write(buffer.getvalue())
+            self._stream.flush()
+
+    def write(self, data):
+        buffer = self._buffers.get(threading.get_ident())
+        target = buffer if buffer is not None else self._stream
+        target.write(data)
+
+    def flush(self):
+        self._stream.flush()
 
 
 def simple_test(halt_on_exception=False):
@@ -87,6 +114,31 @@ def simple_test(halt_on_exception=False):
     return decorator_func
 
 
+async def run_concurrent(client: Client, tests):
+    """
+    Run independent tests concurrently.
+
+    The sync test functions are pushed to worker threads and
+    awaited together, overlapping their network round trips.
+    Output is buffered per test so reports don't interleave.
+    """
+    proxy = ThreadOutput(sys.stdout)
+    sys.stdout = proxy
+
+    def run(test):
+        proxy.register()
+        try:
+            test(client)
+        finally:
+            proxy.release()
+
+    loop = asyncio.get_running_loop()
+    try:
+        await asyncio.gather(*(loop.run_in_executor(None, run, test) for test in tests))
+    finally:
+        sys.stdout = proxy._stream
+
+
 def main():
     if CACHET_ENDPOINT is None:
         raise ValueError("CACHET_ENDPOINT enviroment variable missing")
@@ -94,19 +146,23 @@ def main():
     if CACHET_API_TOKEN is None:
         raise ValueError("CACHET_API_TOKEN enviroment variable missing")
 
-    # Version 2.3.x features
-    test_ping()
-    test_version()
-    test_components()
-    test_component_groups()
-    test_subscribers()
-    test_incidents()
-    test_metrics()
-    test_metric_points()
-
-    # Version 2.4.x features
-    # test_incident_updates()
-    # test_schedules()
+    # Share one pooled http session across all tests
+    # and close it deterministically when done
+    with cachetclient.Client(endpoint=CACHET_ENDPOINT, api_token=CACHET_API_TOKEN) as client:
+        # Version 2.3.x features.
+        # Read-only probes are independent and can overlap
+        asyncio.run(run_concurrent(client, [test_ping, test_version]))
+        # These mutate shared server state and run sequentially
+        test_components(client)
+        test_component_groups(client)
+        test_subscribers(client)
+        test_incidents(client)
+        test_metrics(client)
+        test_metric_points(client)
+
+        # Version 2.4.x features
+        # test_incident_updates(client)
+        # test_schedules(client)
 
     print("=" * 80)
     print("Numer of tests    :", Stats.NUM_TESTS)
@@ -117,15 +173,15 @@ def main():
 
 
 @simple_test()
-def test_ping():
-    result = client().ping()
+def test_ping(client: Client):
+    result = client.ping()
     if result is not True:
         raise ValueError("Ping failed. {} ({}) returned instead of True (bool)".format(result, type(result)))
 
 
 @simple_test()
-def test_version():
-    version = client().version()
+def test_version(client: Client):
+    version = client.version()
     if version.value is not str and len(version.value) < 3:
         raise ValueError("Version value string suspicious? '{}'".format(version.value))
 
@@ -135,8 +191,8 @@ def test_version():
 
 
 @simple_test()
-def test_components():
-    comp = client().components.create(
+def test_components(client: Client):
+    comp = client.components.create(
         name="Test Component",
         status=enums.COMPONENT_STATUS_OPERATIONAL,
         description="This is a test",
@@ -170,7 +226,7 @@ def test_components():
     assert comp.tags == {'moo', 'boo'}, "Tags differs"
 
     # Call update directly on the manager
-    comp = client().components.update(
+    comp = client.components.update(
         comp.id,
         status=enums.COMPONENT_STATUS_OPERATIONAL,
         name="A new component name",
@@ -188,8 +244,8 @@ def test_components():
 
 
 @simple_test()
-def test_component_groups():
-    grp = client().component_groups.create(name="Test Group", order=1)
+def test_component_groups(client: Client):
+    grp = client.component_groups.create(name="Test Group", order=1)
     assert grp.id > 0
     assert grp.name == "Test Group"
     assert grp.order == 1
@@ -198,7 +254,7 @@ def test_component_groups():
     assert grp.is_operational is True
 
     # Re-fetch by id
-    grp = client().component_groups.get(grp.id)
+    grp = client.component_groups.get(grp.id)
 
     # Update group
     grp.order = 2
@@ -216,32 +272,32 @@ def test_component_groups():
 
 
 @simple_test()
-def test_subscribers():
-    new_sub = client().subscribers.create(email='user@example.test')
+def test_subscribers(client: Client):
+    new_sub = client.subscribers.create(email='user@example.test')
 
     assert isinstance(new_sub.created_at, datetime)
     assert isinstance(new_sub.updated_at, datetime)
     assert isinstance(new_sub.verified_at, datetime)
 
     # Rought subscriber count check
-    count = client().subscribers.count()
+    count = client.subscribers.count()
     if count == 0:
         raise ValueError("Subscriber count is 0")
 
     # Iterate subscribers
-    for sub in client().subscribers.list():
+    for sub in client.subscribers.list():
         print(sub)
 
     # Delete subscriber and recount
     new_sub.delete()
-    count_pre = client().subscribers.count()
+    count_pre = client.subscribers.count()
     if count != count_pre + 1:
         raise ValueError("subscriber count {} != {}".format(count, count_pre))
 
 
 @simple_test()
-def test_incidents():
-    issue = client().incidents.create(
+def test_incidents(client: Client):
+    issue = client.incidents.create(
         name="Something blew up!",
         message="We are looking into it",
         status=enums.INCIDENT_INVESTIGATING,
@@ -253,9 +309,9 @@ def test_incidents():
 
 
 @simple_test()
-def test_incident_updates():
+def test_incident_updates(client: Client):
     """Requires 2.4"""
-    incident = client().incidents.create(
+    incident = client.incidents.create(
         "Something blew up!",
         "We are looking into it",
         enums.INCIDENT_INVESTIGATING,
@@ -264,7 +320,7 @@ def test_incident_updates():
         component_status=enums.COMPONENT_STATUS_MAJOR_OUTAGE,
     )
 
-    client().incident_updates.create(
+    client.incident_updates.create(
         incident.id,
         enums.INCIDENT_IDENTIFIED,
         "We have found the source",
@@ -275,18 +331,18 @@ def test_incident_updates():
 
 
 @simple_test()
-def test_schedules():
-    sch = client().schedules.create("Test Schedule", "Shits gonna happen", None)
+def test_schedules(client: Client):
+    sch = client.schedules.create("Test Schedule", "Shits gonna happen", None)
     pprint(sch.attrs, indent=2)
 
 
 @simple_test()
-def test_metrics():
+def test_metrics(client: Client):
     print("HELLO")
 
 
 @simple_test()
-def test_metric_points():
+def test_metric_points(client: Client):
     pass
 
 
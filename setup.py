@@ -1,5 +1,24 @@
+import os
+
 from setuptools import setup
 
+# Opt-in native compilation of the hottest support modules with
+# mypyc. Set CACHET_CLIENT_MYPYC=1 when building to compile them to
+# extension modules. The default remains a pure python build so the
+# package stays installable everywhere. The resource and manager
+# modules stay interpreted: mypyc does not implement async generators
+# (base.py) and rejects the __getattr__ dispatch on Incident when its
+# base class is not compiled.
+ext_modules = []
+if os.environ.get('CACHET_CLIENT_MYPYC'):
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        '--implicit-optional',
+        '--ignore-missing-imports',
+        'cachetclient/cache.py',
+        'cachetclient/concurrency.py',
+        'cachetclient/utils.py',
+    ])
 
 setup(
     name="cachet-client",
@@ -15,18 +34,25 @@ setup(
     packages=['cachetclient', 'cachetclient.v1'],
     include_package_data=True,
     keywords=['cachet', 'client', 'api'],
-    python_requires='>=3.5',
+    python_requires='>=3.7',
     classifiers=[
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
         'License :: OSI Approved :: BSD License',
     ],
     install_requires=[
         'requests>=2.21.0'
     ],
+    extras_require={
+        'async': ['httpx>=0.23.0'],
+        'streaming': ['ijson>=3.0'],
+        'speedups': ['orjson>=3.0'],
+        'compression': ['brotli>=1.0', 'zstandard>=0.15'],
+    },
+    ext_modules=ext_modules,
     entry_points={'console_scripts': [
         'cachet = cachetclient.cli:execute_from_command_line',
     ]},
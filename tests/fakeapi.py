@@ -49,7 +49,8 @@ class FakeData:
         """Get a single resource"""
         resource_id = int(resource_id)
         data = self.get_by_id(resource_id)
-        return FakeHttpResponse(data={'data': data})
+        # Copy like a real server serializing a response
+        return FakeHttpResponse(data={'data': dict(data)})
 
     def _list(self, per_page=20, page=1, filter_data=None):
         """Generic list with pagination"""
@@ -349,7 +350,7 @@ class FakeHttpClient:
     """Fake implementation of the httpclient"""
     is_fake_client = True
 
-    def __init__(self, base_url, api_token, timeout=None, verify_tls=True, user_agent=None):
+    def __init__(self, base_url, api_token, timeout=None, verify_tls=True, user_agent=None, **kwargs):
         self.routes = Routes()
         self.base_url = base_url
         self.api_token = api_token
@@ -357,7 +358,7 @@ class FakeHttpClient:
         self.verify_tls = verify_tls
         self.user_agent = user_agent
 
-    def get(self, path, params=None):
+    def get(self, path, params=None, stream=False, headers=None):
         return self.request('get', path, params=params)
 
     def post(self, path, data=None, params=None):
@@ -369,14 +370,37 @@ class FakeHttpClient:
     def delete(self, path, resource_id):
         return self.request('delete', "{}/{}".format(path, resource_id))
 
-    def request(self, method, path, params=None, data=None):
+    def request(self, method, path, params=None, data=None, stream=False):
         return self.routes.dispatch(method, path, params=params, data=data)
 
+    def close(self):
+        pass
+
+
+class FakeAsyncHttpClient(FakeHttpClient):
+    """Fake implementation of the async httpclient"""
+
+    async def get(self, path, params=None):
+        return self.request('get', path, params=params)
+
+    async def post(self, path, data=None, params=None):
+        return self.request('post', path, data=data, params=params)
+
+    async def put(self, path, data=None, params=None):
+        return self.request('put', path, data=data, params=params)
+
+    async def delete(self, path, resource_id):
+        return self.request('delete', "{}/{}".format(path, resource_id))
+
+    async def close(self):
+        pass
+
 
 class FakeHttpResponse:
 
-    def __init__(self, data=None, status_code=200):
+    def __init__(self, data=None, status_code=200, headers=None):
         self.status_code = status_code
+        self.headers = headers or {}
         self._data = data
 
     def json(self):
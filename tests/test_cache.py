@@ -0,0 +1,182 @@
+import threading
+import time
+from unittest import TestCase, mock
+
+from requests.exceptions import ConnectionError, HTTPError, RetryError
+
+from base import CachetTestcase
+from fakeapi import FakeHttpClient, FakeHttpResponse
+from cachetclient.cache import TTLCache
+from cachetclient.v1.incidents import IncidentManager
+from cachetclient.v1 import enums
+
+
+class TTLCacheTests(TestCase):
+
+    def test_get_set(self):
+        cache = TTLCache()
+        cache.set('incidents/1', {'id': 1}, 10)
+        self.assertEqual(cache.get('incidents/1'), {'id': 1})
+        self.assertIsNone(cache.get('incidents/2'))
+
+    def test_expiry(self):
+        cache = TTLCache()
+        cache.set('incidents/1', {'id': 1}, -1)
+        self.assertIsNone(cache.get('incidents/1'))
+
+    def test_stale(self):
+        cache = TTLCache()
+        cache.set('incidents/1', {'id': 1}, 10)
+        self.assertEqual(cache.get_stale('incidents/1'), {'id': 1})
+        self.assertIsNone(cache.get_stale('incidents/2'))
+
+    def test_invalidate_prefix(self):
+        cache = TTLCache()
+        cache.set('incidents/1', {'id': 1}, 10)
+        cache.set('incidents?count', 1, 10)
+        cache.set('components/1', {'id': 1}, 10)
+        cache.invalidate_prefix('incidents')
+        self.assertIsNone(cache.get('incidents/1'))
+        self.assertIsNone(cache.get('incidents?count'))
+        self.assertEqual(cache.get('components/1'), {'id': 1})
+
+    def test_lru_bound(self):
+        cache = TTLCache(maxsize=2)
+        cache.set('a', 1, 10)
+        cache.set('b', 2, 10)
+        cache.set('c', 3, 10)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('a'))
+
+    def test_thread_safety(self):
+        """Concurrent writes and prefix invalidation must not corrupt the cache"""
+        cache = TTLCache(maxsize=64)
+        errors = []
+
+        def writer():
+            try:
+                for i in range(500):
+                    cache.set('incidents/{}'.format(i % 50), {'id': i}, 10)
+                    cache.get('incidents/{}'.format(i % 50))
+            except Exception as ex:
+                errors.append(ex)
+
+        def invalidator():
+            try:
+                for _ in range(500):
+                    cache.invalidate_prefix('incidents')
+            except Exception as ex:
+                errors.append(ex)
+
+        threads = [threading.Thread(target=writer) for _ in range(4)]
+        threads += [threading.Thread(target=invalidator) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+
+@mock.patch('cachetclient.client.HttpClient', new=FakeHttpClient)
+class IncidentCacheTests(CachetTestcase):
+
+    @mock.patch('cachetclient.client.HttpClient', new=FakeHttpClient)
+    def setUp(self):
+        self.client = self.create_client()
+
+    def test_get_cached(self):
+        issue = self.client.incidents.create(
+            name="Issue",
+            message="Descr",
+            status=enums.INCIDENT_INVESTIGATING,
+        )
+
+        # First read populates the cache
+        self.assertEqual(self.client.incidents.get(issue.id).name, "Issue")
+
+        # Change server side data behind the client's back.
+        # The cached response should still be served.
+        self.client._http.routes.incidents.get_by_id(issue.id)['name'] = "Changed"
+        self.assertEqual(self.client.incidents.get(issue.id).name, "Issue")
+
+        # Mutations invalidate the cache
+        self.client.incidents.update(
+            issue.id,
+            name="Changed",
+            message="Descr",
+            status=enums.INCIDENT_INVESTIGATING,
+            visible=True,
+        )
+        self.assertEqual(self.client.incidents.get(issue.id).name, "Changed")
+
+    def test_count_cached(self):
+        self.client.incidents.create(name="Issue", message="Descr", status=enums.INCIDENT_INVESTIGATING)
+        self.assertEqual(self.client.incidents.count(), 1)
+
+        # Cached until the next mutation
+        self.client._http.routes.incidents.data.clear()
+        self.assertEqual(self.client.incidents.count(), 1)
+
+        self.client.incidents.create(name="Issue 2", message="Descr", status=enums.INCIDENT_INVESTIGATING)
+        self.assertEqual(self.client.incidents.count(), 1)
+
+    def test_stale_fallback(self):
+        """Outages serve a stale entry, client errors always raise"""
+        class FlakyHttpClient:
+            def __init__(self):
+                self.error = None
+
+            def get(self, path, params=None, stream=False, headers=None):
+                if self.error is not None:
+                    raise self.error
+                return FakeHttpResponse(data={'data': {'id': 1, 'name': "Issue"}})
+
+        http = FlakyHttpClient()
+        manager = IncidentManager(http, None, cache_ttl=0.01)
+
+        self.assertEqual(manager.get(1).name, "Issue")
+        # Wait for the entry to go stale
+        time.sleep(0.02)
+
+        outages = (
+            ConnectionError(),
+            RetryError(),
+            HTTPError(response=FakeHttpResponse(status_code=500)),
+        )
+        for error in outages:
+            http.error = error
+            self.assertEqual(manager.get(1).name, "Issue")
+
+        # A 404 is a real answer, not an outage
+        http.error = HTTPError(response=FakeHttpResponse(status_code=404))
+        with self.assertRaises(HTTPError):
+            manager.get(1)
+
+    def test_conditional_get(self):
+        """An expired entry with an etag is re-validated with If-None-Match"""
+        class ETagHttpClient:
+            def __init__(self):
+                self.requests = []
+
+            def get(self, path, params=None, stream=False, headers=None):
+                self.requests.append(headers)
+                if headers and headers.get('If-None-Match') == '"abc"':
+                    return FakeHttpResponse(status_code=304)
+
+                return FakeHttpResponse(
+                    data={'data': {'id': 1, 'name': "Issue"}},
+                    headers={'ETag': '"abc"'},
+                )
+
+        http = ETagHttpClient()
+        manager = IncidentManager(http, None, cache_ttl=0.01)
+
+        self.assertEqual(manager.get(1).name, "Issue")
+        # Wait for the entry to expire, forcing re-validation
+        time.sleep(0.02)
+        self.assertEqual(manager.get(1).name, "Issue")
+
+        self.assertEqual(len(http.requests), 2)
+        self.assertIsNone(http.requests[0])
+        self.assertEqual(http.requests[1], {'If-None-Match': '"abc"'})
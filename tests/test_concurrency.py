@@ -0,0 +1,166 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from requests.exceptions import HTTPError, RetryError
+from urllib3.exceptions import MaxRetryError, ResponseError
+
+from fakeapi import FakeHttpResponse
+from cachetclient.concurrency import (
+    AdaptiveSemaphore,
+    AsyncAdaptiveSemaphore,
+    AsyncSingleFlight,
+    SingleFlight,
+    is_throttled,
+)
+
+
+class IsThrottledTests(TestCase):
+
+    def test_response_status(self):
+        error = HTTPError(response=FakeHttpResponse(status_code=429))
+        self.assertTrue(is_throttled(error))
+        self.assertFalse(is_throttled(HTTPError(response=FakeHttpResponse(status_code=500))))
+
+    def test_retry_error(self):
+        """A 429 swallowed by the transport adapter's retries is still detected"""
+        reason = ResponseError('too many 429 error responses')
+        self.assertTrue(is_throttled(RetryError(MaxRetryError(None, '/incidents', reason=reason))))
+
+        reason = ResponseError('too many 503 error responses')
+        self.assertFalse(is_throttled(RetryError(MaxRetryError(None, '/incidents', reason=reason))))
+
+    def test_unrelated_error(self):
+        self.assertFalse(is_throttled(RuntimeError('boom')))
+
+
+class AdaptiveSemaphoreTests(TestCase):
+
+    def test_throttle_halves_limit(self):
+        limiter = AdaptiveSemaphore(start=8)
+        limiter.throttle()
+        self.assertEqual(limiter.limit, 4)
+        limiter.throttle()
+        self.assertEqual(limiter.limit, 2)
+
+    def test_throttle_respects_floor(self):
+        limiter = AdaptiveSemaphore(start=2, floor=1)
+        for _ in range(5):
+            limiter.throttle()
+        self.assertEqual(limiter.limit, 1)
+
+    def test_success_streak_raises_limit(self):
+        limiter = AdaptiveSemaphore(start=8, ceil=16, increase_after=3)
+        limiter.throttle()
+        self.assertEqual(limiter.limit, 4)
+        for _ in range(3):
+            limiter.success()
+        self.assertEqual(limiter.limit, 5)
+        # A new throttle resets the streak
+        limiter.throttle()
+        limiter.success()
+        limiter.success()
+        self.assertEqual(limiter.limit, 2)
+
+    def test_success_respects_ceil(self):
+        limiter = AdaptiveSemaphore(start=4, ceil=4, increase_after=1)
+        for _ in range(5):
+            limiter.success()
+        self.assertEqual(limiter.limit, 4)
+
+    def test_context_manager(self):
+        limiter = AdaptiveSemaphore(start=2)
+        with limiter:
+            self.assertEqual(limiter._active, 1)
+        self.assertEqual(limiter._active, 0)
+
+
+class AsyncAdaptiveSemaphoreTests(TestCase):
+
+    def test_throttle_and_success(self):
+        limiter = AsyncAdaptiveSemaphore(start=8, increase_after=2)
+        limiter.throttle()
+        self.assertEqual(limiter.limit, 4)
+        limiter.success()
+        limiter.success()
+        self.assertEqual(limiter.limit, 5)
+
+    def test_context_manager(self):
+        async def scenario():
+            limiter = AsyncAdaptiveSemaphore(start=2)
+            async with limiter:
+                self.assertEqual(limiter._active, 1)
+            self.assertEqual(limiter._active, 0)
+
+        asyncio.run(scenario())
+
+
+class SingleFlightTests(TestCase):
+
+    def test_coalesces_concurrent_calls(self):
+        flight = SingleFlight()
+        calls = []
+
+        def func():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'value'
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: flight.do('key', func), range(4)))
+
+        self.assertEqual(results, ['value'] * 4)
+        self.assertEqual(len(calls), 1)
+
+        # The key is released after completion
+        flight.do('key', func)
+        self.assertEqual(len(calls), 2)
+
+    def test_error_propagates(self):
+        flight = SingleFlight()
+
+        def func():
+            raise RuntimeError('boom')
+
+        with self.assertRaises(RuntimeError):
+            flight.do('key', func)
+
+        self.assertEqual(len(flight._flights), 0)
+
+
+class AsyncSingleFlightTests(TestCase):
+
+    def test_coalesces_concurrent_calls(self):
+        async def scenario():
+            flight = AsyncSingleFlight()
+            calls = []
+
+            async def func():
+                calls.append(1)
+                await asyncio.sleep(0.01)
+                return 'value'
+
+            results = await asyncio.gather(*(flight.do('key', func) for _ in range(4)))
+            self.assertEqual(results, ['value'] * 4)
+            self.assertEqual(len(calls), 1)
+
+            # The key is released after completion
+            await flight.do('key', func)
+            self.assertEqual(len(calls), 2)
+
+        asyncio.run(scenario())
+
+    def test_error_propagates(self):
+        async def scenario():
+            flight = AsyncSingleFlight()
+
+            async def func():
+                raise RuntimeError('boom')
+
+            with self.assertRaises(RuntimeError):
+                await flight.do('key', func)
+
+            self.assertEqual(len(flight._flights), 0)
+
+        asyncio.run(scenario())
@@ -1,9 +1,14 @@
+import asyncio
+import io
+import json
+import unittest
 from datetime import datetime
 from unittest import mock
 from requests.exceptions import HTTPError
 
 from base import CachetTestcase
-from fakeapi import FakeHttpClient
+from fakeapi import FakeAsyncHttpClient, FakeHttpClient
+from cachetclient import base as cachet_base
 from cachetclient.v1 import enums
 
 
@@ -29,6 +34,152 @@ class IncidentTests(CachetTestcase):
         incident = self.client.incidents.get(first.id)
         self.assertEqual(first.id, incident.id)
 
+    def test_list_parallel(self):
+        for i in range(5):
+            self.client.incidents.create(
+                name="Issue {}".format(i),
+                message="Descr",
+                status=enums.INCIDENT_INVESTIGATING,
+            )
+
+        incidents = list(self.client.incidents.list_parallel(per_page=2))
+        self.assertEqual(len(incidents), 5)
+        # Page order is preserved
+        self.assertEqual([i.id for i in incidents], [1, 2, 3, 4, 5])
+
+    @unittest.skipIf(cachet_base.ijson is None, "ijson not installed")
+    def test_list_streaming(self):
+        """Pages exposing a raw stream are parsed incrementally"""
+        class StreamingResponse:
+            def __init__(self, data):
+                self.raw = io.BytesIO(json.dumps(data).encode())
+
+            def close(self):
+                pass
+
+        class StreamingHttpClient:
+            def __init__(self):
+                self.requests = 0
+
+            def get(self, path, params=None, stream=False, headers=None):
+                self.requests += 1
+                return StreamingResponse({
+                    'meta': {'pagination': {'total_pages': 1}},
+                    'data': [{'id': 1, 'name': "Component 1"}, {'id': 2, 'name': "Component 2"}],
+                })
+
+        # Incident listing caches page bodies for conditional requests,
+        # so exercise the streaming path through a plain manager
+        http = StreamingHttpClient()
+        manager = self.client.components
+        manager._http = http
+
+        components = list(manager.list(per_page=20))
+        self.assertEqual(http.requests, 1)
+        self.assertEqual([c.id for c in components], [1, 2])
+
+    @unittest.skipIf(cachet_base.ijson is None, "ijson not installed")
+    def test_list_streaming_capped_per_page(self):
+        """A server capping per_page below the requested size must not truncate"""
+        class StreamingResponse:
+            def __init__(self, data):
+                self.raw = io.BytesIO(json.dumps(data).encode())
+
+            def close(self):
+                pass
+
+        class StreamingHttpClient:
+            def __init__(self):
+                self.requests = 0
+
+            def get(self, path, params=None, stream=False, headers=None):
+                self.requests += 1
+                # One entry per page no matter how many were asked for
+                return StreamingResponse({
+                    'meta': {'pagination': {'total_pages': 2}},
+                    'data': [{'id': params['page'], 'name': "Component"}],
+                })
+
+        http = StreamingHttpClient()
+        manager = self.client.components
+        manager._http = http
+
+        components = list(manager.list(per_page=20))
+        self.assertEqual(http.requests, 2)
+        self.assertEqual([c.id for c in components], [1, 2])
+
+    @unittest.skipIf(cachet_base.ijson is None, "ijson not installed")
+    def test_list_streaming_early_close(self):
+        """Abandoning the generator mid-page closes the streamed response"""
+        class StreamingResponse:
+            def __init__(self, data):
+                self.raw = io.BytesIO(json.dumps(data).encode())
+                self.closed = False
+
+            def close(self):
+                self.closed = True
+
+        responses = []
+
+        class StreamingHttpClient:
+            def get(self, path, params=None, stream=False, headers=None):
+                response = StreamingResponse({
+                    'meta': {'pagination': {'total_pages': 1}},
+                    'data': [{'id': 1, 'name': "Component 1"}, {'id': 2, 'name': "Component 2"}],
+                })
+                responses.append(response)
+                return response
+
+        manager = self.client.components
+        manager._http = StreamingHttpClient()
+
+        generator = manager.list(per_page=20)
+        next(generator)
+        generator.close()
+
+        self.assertTrue(responses[0].closed)
+
+    def test_list_raw(self):
+        for i in range(3):
+            self.client.incidents.create(
+                name="Issue {}".format(i),
+                message="Descr",
+                status=enums.INCIDENT_INVESTIGATING,
+            )
+
+        entries = list(self.client.incidents.list_raw())
+        self.assertEqual(len(entries), 3)
+        for entry in entries:
+            self.assertIsInstance(entry, dict)
+
+    def test_create_many(self):
+        result = self.client.incidents.create_many([
+            {'name': "Issue 1", 'message': "Descr", 'status': enums.INCIDENT_INVESTIGATING},
+            {'name': "Issue 2", 'message': "Descr", 'status': enums.INCIDENT_INVESTIGATING},
+            # Missing required name argument
+            {'message': "Descr", 'status': enums.INCIDENT_INVESTIGATING},
+        ])
+        self.assertFalse(result.ok)
+        self.assertEqual(len(result.successes), 2)
+        self.assertEqual(len(result.failures), 1)
+        self.assertIsInstance(result.failures[0][1], TypeError)
+        self.assertEqual(self.client.incidents.count(), 2)
+
+        updates = self.client.incidents.update_many([
+            {
+                'incident_id': issue.id,
+                'name': issue.name,
+                'message': "Fixed",
+                'status': enums.INCIDENT_FIXED,
+                'visible': True,
+            }
+            for issue in result.successes
+        ])
+        self.assertTrue(updates.ok)
+        self.assertEqual(len(updates.successes), 2)
+        for issue in updates.successes:
+            self.assertEqual(issue.status, enums.INCIDENT_FIXED)
+
     def test_create(self):
         issue = self.client.incidents.create(
             name="Something blew up!",
@@ -48,6 +199,9 @@ class IncidentTests(CachetTestcase):
         self.assertIsInstance(issue.updated_at, datetime)
         self.assertIsInstance(issue.scheduled_at, datetime)
 
+        # Parsed datetimes are memoized per instance
+        self.assertIs(issue.created_at, issue.created_at)
+
         # Do an update on the resource
         issue.name = "Something probably blew up?!"
         issue = issue.update()
@@ -68,3 +222,50 @@ class IncidentTests(CachetTestcase):
         self.assertIsInstance(issue.scheduled_at, datetime)
 
         issue.delete()
+
+    @mock.patch('cachetclient.v1.client.AsyncHttpClient', new=FakeAsyncHttpClient)
+    def test_async(self):
+        asyncio.run(self._async_scenario())
+
+    async def _async_scenario(self):
+        incidents = self.client.incidents_async
+
+        first = await incidents.acreate(
+            name="Issue 1",
+            message="Descr",
+            status=enums.INCIDENT_INVESTIGATING,
+        )
+        await incidents.acreate(name="Issue 2", message="Descr", status=enums.INCIDENT_INVESTIGATING)
+        await incidents.acreate(name="Issue 3", message="Descr", status=enums.INCIDENT_INVESTIGATING)
+
+        self.assertEqual(await incidents.acount(), 3)
+
+        entries = [issue async for issue in incidents.alist()]
+        self.assertEqual(len(entries), 3)
+
+        entries = [issue async for issue in incidents.alist_parallel(per_page=1)]
+        self.assertEqual(len(entries), 3)
+
+        # Re-fetch a single issue
+        issue = await incidents.aget(first.id)
+        self.assertEqual(first.id, issue.id)
+
+        # Parallel gets share the request but not the instance
+        one, other = await asyncio.gather(incidents.aget(first.id), incidents.aget(first.id))
+        one.name = "Changed"
+        self.assertNotEqual(other.name, "Changed")
+
+        issue = await incidents.aupdate(
+            first.id,
+            name="Issue 1",
+            message="All good",
+            status=enums.INCIDENT_FIXED,
+            visible=True,
+        )
+        self.assertEqual(issue.status, enums.INCIDENT_FIXED)
+
+        await incidents.adelete(first.id)
+        self.assertEqual(await incidents.acount(), 2)
+
+        # Release the async connection pool
+        await self.client.aclose()